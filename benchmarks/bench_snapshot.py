@@ -0,0 +1,73 @@
+"""Memoria por producto: objetos ORM vs CatalogSnapshot.
+
+    python benchmarks/bench_snapshot.py --products 20000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from service.app import create_app  # noqa: E402
+from service.models import Category, Product, db  # noqa: E402
+from service.snapshot import CatalogSnapshot  # noqa: E402
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=20000)
+    args = parser.parse_args()
+
+    app = create_app(testing=True)
+    with app.app_context():
+        categories = list(Category)
+        db.session.execute(
+            db.insert(Product),
+            [
+                {
+                    "name": f"Product {i % 50}",
+                    "description": f"Benchmark product number {i}",
+                    "price": Decimal(i % 1000) / 10,
+                    "available": i % 3 != 0,
+                    "category": categories[i % len(categories)],
+                }
+                for i in range(args.products)
+            ],
+        )
+        db.session.commit()
+
+        orm, orm_bytes = _measure(lambda: Product.query.all())
+        del orm
+        db.session.expunge_all()
+
+        def _load():
+            snapshot = CatalogSnapshot()
+            snapshot.load()
+            return snapshot
+
+        snapshot, snap_bytes = _measure(_load)
+
+    n = args.products
+    print(f"products={n}")
+    print(f"orm       {orm_bytes / n:8.1f} B/product")
+    print(f"snapshot  {snap_bytes / n:8.1f} B/product "
+          f"(memory_bytes(): {snapshot.memory_bytes() / n:.1f})")
+    print(f"ratio     {orm_bytes / snap_bytes:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark de RPS de GET /products/<id> según la cantidad de workers.
+
+    python benchmarks/bench_workers.py --duration 5 --workers 1 2 4
+
+Levanta gunicorn (gunicorn.conf.py) sobre una base SQLite temporal para cada
+cantidad de workers y lo satura con varios procesos cliente.
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _request(port, method, path, body=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    headers = {"Content-Type": "application/json"} if body else {}
+    conn.request(method, path, body=json.dumps(body) if body else None, headers=headers)
+    resp = conn.getresponse()
+    data = resp.read()
+    conn.close()
+    return resp.status, data
+
+
+def _wait_ready(port, deadline=15.0):
+    start = time.monotonic()
+    while time.monotonic() - start < deadline:
+        try:
+            if _request(port, "GET", "/ready")[0] == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("gunicorn no respondió a /ready")
+
+
+def _seed(port, count=100):
+    ids = []
+    for i in range(count):
+        _, data = _request(port, "POST", "/products", {
+            "name": f"Bench {i}",
+            "description": "benchmark",
+            "price": "9.99",
+            "available": True,
+            "category": "TOOLS",
+        })
+        ids.append(json.loads(data)["id"])
+    return ids
+
+
+def _client(port, ids, duration, counter):
+    done = 0
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        _request(port, "GET", f"/products/{ids[done % len(ids)]}")
+        done += 1
+    with counter.get_lock():
+        counter.value += done
+
+
+def run(workers, duration, clients, port):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            DATABASE_URI=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            WEB_CONCURRENCY=str(workers),
+            PORT=str(port),
+            COMPACTION_INTERVAL="0",
+            LOAD_SHEDDING="false",
+            GUNICORN_ACCESSLOG="",
+        )
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"],
+            cwd=ROOT, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_ready(port)
+            ids = _seed(port)
+            counter = multiprocessing.Value("i", 0)
+            procs = [
+                multiprocessing.Process(target=_client, args=(port, ids, duration, counter))
+                for _ in range(clients)
+            ]
+            for p in procs:
+                p.start()
+            for p in procs:
+                p.join()
+            return counter.value / duration
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cores} - {0}))
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=2 * cores)
+    parser.add_argument("--port", type=int, default=8099)
+    args = parser.parse_args()
+
+    print(f"cores={cores} clients={args.clients} duration={args.duration}s")
+    print(f"{'workers':>8} {'rps':>10} {'speedup':>8}")
+    base = None
+    for w in args.workers:
+        rps = run(w, args.duration, args.clients, args.port)
+        base = base or rps
+        print(f"{w:>8} {rps:>10.1f} {rps / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Configuración de gunicorn (servidor WSGI con workers preforkeados).
+
+    gunicorn            # usa este archivo y su wsgi_app automáticamente
+
+Variables de entorno: PORT, WEB_CONCURRENCY (workers), GUNICORN_THREADS,
+GUNICORN_PRELOAD, GUNICORN_TIMEOUT, COMPACTOR_LOCK,
+GUNICORN_ACCESSLOG ("" desactiva el log de accesos).
+"""
+import fcntl
+import multiprocessing
+import os
+import sys
+import tempfile
+
+# worker=True: los workers no migran el esquema ni arrancan la compactación
+wsgi_app = "service.app:create_app(worker=True)"
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+# gthread por defecto: los límites de concurrencia de service/limits.py son
+# por proceso y con workers sync (un request a la vez) nunca se llenarían.
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread" if threads > 1 else "sync"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+# Con preload la app se crea una sola vez en el master (sin hilos); cada
+# worker recrea sus conexiones en post_fork.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("true", "1", "yes")
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-") or None
+
+# Los token buckets de service/limits.py también son por worker: el límite
+# efectivo por cliente es workers × rate.
+# La caché de listados (y CATALOG_SNAPSHOT) es por proceso y sólo ve las
+# escrituras del propio proceso: con varios workers quedaría desactualizada.
+if workers > 1:
+    if os.getenv("LIST_CACHE_MAX_BYTES", "1") != "0":
+        print(
+            "WARNING: la caché de listados requiere WEB_CONCURRENCY=1; "
+            f"se desactiva con {workers} workers",
+            file=sys.stderr,
+        )
+    os.environ["LIST_CACHE_MAX_BYTES"] = "0"
+    if os.getenv("CATALOG_SNAPSHOT", "false").lower() in ("true", "1", "yes"):
+        print(
+            "WARNING: CATALOG_SNAPSHOT requiere WEB_CONCURRENCY=1; "
+            f"se desactiva con {workers} workers",
+            file=sys.stderr,
+        )
+        os.environ["CATALOG_SNAPSHOT"] = "false"
+
+# Lock que elige al único worker que ejecuta la compactación
+compactor_lock = os.getenv(
+    "COMPACTOR_LOCK",
+    os.path.join(
+        tempfile.gettempdir(), f"products-compactor-{bind.rsplit(':', 1)[-1]}.lock"
+    ),
+)
+
+
+def _migrate_schema():
+    from service.app import migrate  # pylint: disable=import-outside-toplevel
+
+    migrate()
+
+
+# Este archivo se ejecuta en el master antes de cargar la app (también con
+# preload): la migración y el VACUUM único corren en un solo proceso.
+_migrate_schema()
+
+
+def post_fork(server, worker):
+    """Descarta el pool heredado del master y recarga el snapshot.
+
+    El snapshot precargado es una copia del arranque: un worker reemplazado
+    (timeout, crash, max_requests) lo recibiría desactualizado.
+    """
+    if not server.cfg.preload_app:
+        return
+    from service.models import db  # pylint: disable=import-outside-toplevel
+
+    app = worker.app.wsgi()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+        snapshot = app.extensions.get("catalog_snapshot")
+        if snapshot is not None:
+            snapshot.load()
+            db.session.remove()
+
+
+def post_worker_init(worker):
+    """Arranca la compactación en el único worker que obtiene el lock.
+
+    El lock se libera cuando ese worker muere, y el worker que lo reemplaza
+    lo vuelve a tomar.
+    """
+    lock = open(compactor_lock, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock.close()
+        return
+    worker.compactor_lock = lock
+    from service.app import start_compactor  # pylint: disable=import-outside-toplevel
+
+    start_compactor(worker.wsgi)
+    worker.log.info("Compactación activa en el worker %s", worker.pid)
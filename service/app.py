@@ -1,21 +1,84 @@
+import os
+
 from flask import Flask
+from service.cache import ListCache
+from service.compaction import Compactor
+from service.limits import LoadShedder
 from service.models import Product, db
 from service.routes import bp as api
+from service.snapshot import CatalogSnapshot
 
 
-def create_app(testing: bool = False) -> Flask:
+def _configured_app(testing: bool) -> Flask:
     app = Flask(__name__)
     app.config.update(
         SQLALCHEMY_DATABASE_URI=(
-            "sqlite:///:memory:" if testing else "sqlite:///products.db"
+            "sqlite:///:memory:"
+            if testing
+            else os.getenv("DATABASE_URI", "sqlite:///products.db")
         ),
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
         TESTING=testing,
+        # Segundos entre ciclos de compactación de tombstones (0 = desactivado)
+        COMPACTION_INTERVAL=float(
+            os.getenv("COMPACTION_INTERVAL", "0" if testing else "300")
+        ),
+        COMPACTION_BATCH_SIZE=int(os.getenv("COMPACTION_BATCH_SIZE", "500")),
+        # Caché de listados codificados (0 bytes = desactivada)
+        LIST_CACHE_MAX_BYTES=int(os.getenv("LIST_CACHE_MAX_BYTES", str(8 << 20))),
+        LIST_CACHE_MAX_ENTRIES=int(os.getenv("LIST_CACHE_MAX_ENTRIES", "1024")),
+        # Lecturas desde un snapshot en memoria (despliegues read-mostly)
+        CATALOG_SNAPSHOT=os.getenv("CATALOG_SNAPSHOT", "false").lower()
+        in ("true", "1", "yes"),
+        # Rate limiting por cliente y límite de concurrencia por clase de ruta
+        LOAD_SHEDDING=os.getenv(
+            "LOAD_SHEDDING", "false" if testing else "true"
+        ).lower()
+        in ("true", "1", "yes"),
     )
+    return app
 
-    Product.init_db(app)
+
+def create_app(testing: bool = False, worker: bool = False) -> Flask:
+    """Crea la app. Con worker=True (gunicorn, ver gunicorn.conf.py) no migra
+    el esquema ni arranca la compactación: eso corre en un único proceso."""
+    app = _configured_app(testing)
+    Product.init_db(app, migrate=not worker)
     app.register_blueprint(api) 
+    if app.config["LOAD_SHEDDING"]:
+        LoadShedder().init_app(app)
+    # El snapshot se suscribe antes que la caché: al invalidar, ya está al día
+    if app.config["CATALOG_SNAPSHOT"]:
+        snapshot = CatalogSnapshot()
+        snapshot.load()
+        Product.add_write_listener(app, snapshot.refresh)
+        app.extensions["catalog_snapshot"] = snapshot
+    if app.config["LIST_CACHE_MAX_BYTES"] > 0:
+        cache = ListCache(
+            app.config["LIST_CACHE_MAX_BYTES"], app.config["LIST_CACHE_MAX_ENTRIES"]
+        )
+        Product.add_write_listener(app, cache.invalidate)
+        app.extensions["list_cache"] = cache
+    if not worker:
+        start_compactor(app)
     return app
 
 
-app = create_app()
+def start_compactor(app: Flask):
+    """Arranca el hilo de compactación si COMPACTION_INTERVAL > 0"""
+    if app.config["COMPACTION_INTERVAL"] > 0:
+        app.extensions["compactor"] = Compactor(
+            app,
+            app.config["COMPACTION_INTERVAL"],
+            app.config["COMPACTION_BATCH_SIZE"],
+        ).start()
+
+
+def migrate():
+    """Crea/migra el esquema (y el VACUUM único) y suelta las conexiones"""
+    app = _configured_app(testing=False)
+    db.init_app(app)
+    with app.app_context():
+        Product.migrate_schema()
+        for engine in db.engines.values():
+            engine.dispose()
@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+
+# Generación que cubre a los listados sin filtro de categoría
+ALL = "*"
+
+
+class ListCache:
+    """Caché LRU de respuestas de listado ya codificadas (bytes JSON).
+
+    La clave es la tupla normalizada de filtros. Cada entrada recuerda las
+    generaciones de las que depende: un listado filtrado por categoría sólo
+    depende de esa categoría; uno sin filtro depende de la generación
+    global. Una escritura incrementa la generación de su categoría y la
+    global, de modo que sólo invalida las entradas afectadas. Además toda
+    dependencia incluye una época que sube al invalidar todo (reset).
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, max_entries: int = 1024):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._epoch = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def generation(self, scope) -> tuple:
+        """Generación actual del scope (categoría o ALL) para `put`"""
+        with self._lock:
+            return self._dependency(scope)
+
+    def _dependency(self, scope) -> tuple:
+        return (scope, self._generations.get(scope, 0), self._epoch)
+
+    def get(self, key):
+        """Devuelve el cuerpo cacheado o None si no existe o está obsoleto"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                body, dependency = entry
+                if self._dependency(dependency[0]) == dependency:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return body
+                self._drop(key)
+            self.misses += 1
+            return None
+
+    def put(self, key, body: bytes, dependency: tuple):
+        """Guarda `body` ligado a la generación leída antes de consultar"""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if self._dependency(dependency[0]) != dependency:
+                return  # hubo una escritura mientras se consultaba
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (body, dependency)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, categories=None, product_ids=None):
+        """Invalida las categorías dadas (None = todas) y los listados globales"""
+        with self._lock:
+            self.invalidations += 1
+            if categories is None:
+                self._epoch += 1
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for scope in {c.name for c in categories} | {ALL}:
+                self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def stats(self) -> dict:
+        """Métricas de uso de la caché"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _drop(self, key):
+        body, _ = self._entries.pop(key)
+        self._bytes -= len(body)
@@ -5,3 +5,5 @@ HTTP_400_BAD_REQUEST = 400
 HTTP_404_NOT_FOUND = 404
 HTTP_405_METHOD_NOT_ALLOWED = 405
 HTTP_409_CONFLICT = 409
+HTTP_429_TOO_MANY_REQUESTS = 429
+HTTP_503_SERVICE_UNAVAILABLE = 503
@@ -0,0 +1,97 @@
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask
+from service.models import Product, db
+
+logger = logging.getLogger("flask.app")
+
+
+def purge_tombstones(
+    batch_size: int = 500,
+    grace: timedelta = timedelta(0),
+    max_batches: int | None = None,
+) -> int:
+    """Purga en lotes los productos marcados como eliminados.
+
+    Cada lote es una transacción corta (busca IDs por el índice de
+    deleted_at y borra por PK) para no retener el lock de SQLite.
+    Devuelve la cantidad de filas purgadas.
+    """
+    cutoff = datetime.now(timezone.utc) - grace
+    purged = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = [
+            row.id
+            for row in db.session.query(Product.id)
+            .filter(Product.deleted_at.is_not(None), Product.deleted_at <= cutoff)
+            .limit(batch_size)
+        ]
+        if not ids:
+            break
+        db.session.query(Product).filter(Product.id.in_(ids)).delete(
+            synchronize_session=False
+        )
+        db.session.commit()
+        purged += len(ids)
+        batches += 1
+    if purged:
+        logger.info("Compactación: %d productos purgados", purged)
+    return purged
+
+
+def incremental_vacuum(pages: int = 1000):
+    """Libera hasta `pages` páginas libres de SQLite (no-op en otros motores)"""
+    if db.engine.dialect.name != "sqlite":
+        return
+    # Con execute() pysqlite sólo da un paso del PRAGMA (libera una página);
+    # executescript lo ejecuta hasta el final.
+    raw = db.engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(
+            f"PRAGMA incremental_vacuum({int(pages)});"
+        )
+    finally:
+        raw.close()
+
+
+def compact(batch_size: int = 500, vacuum_pages: int = 1000) -> int:
+    """Un ciclo completo: purga tombstones y, si hubo, VACUUM incremental"""
+    purged = purge_tombstones(batch_size=batch_size)
+    if purged:
+        incremental_vacuum(vacuum_pages)
+    return purged
+
+
+class Compactor:
+    """Hilo en segundo plano que ejecuta `compact` cada `interval` segundos"""
+
+    def __init__(self, app: Flask, interval: float, batch_size: int = 500):
+        self.app = app
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="product-compactor", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None):
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    compact(batch_size=self.batch_size)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Error en la compactación de productos")
+                    db.session.rollback()
+                finally:
+                    db.session.remove()
@@ -0,0 +1,137 @@
+import math
+import threading
+import time
+
+from flask import Flask, g, jsonify, request
+from service.common import status
+
+# Clase de ruta por endpoint; los que no figuran (health, index) no se limitan
+ROUTE_CLASSES = {
+    "api.read_product": "read",
+    "api.list_products": "list",
+    "api.create_product": "write",
+    "api.update_product": "write",
+    "api.delete_product": "write",
+    "api.admin_reset": "admin",
+    "api.admin_cache_stats": "admin",
+}
+
+# (tokens por segundo, ráfaga) por cliente y clase de ruta
+DEFAULT_RATES = {
+    "read": (100.0, 200),
+    "list": (5.0, 10),
+    "write": (10.0, 20),
+    "admin": (1.0, 5),
+}
+
+# Requests simultáneos por proceso y clase de ruta (0 = sin límite). Con los
+# 4 threads por worker de gunicorn.conf.py siempre queda uno para lecturas.
+DEFAULT_CONCURRENCY = {
+    "read": 0,
+    "list": 1,
+    "write": 1,
+    "admin": 1,
+}
+
+
+class MemoryBackend:
+    """Token buckets en memoria del proceso (por clave cliente+clase).
+
+    Cada worker tiene los suyos: con N workers un cliente puede llegar a
+    N × rate según qué worker atienda cada request.
+    """
+
+    def __init__(self, clock=time.monotonic, max_keys: int = 10000):
+        self.clock = clock
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, rate: float, burst: int):
+        """Consume un token; devuelve (permitido, segundos hasta el próximo)"""
+        now = self.clock()
+        with self._lock:
+            tokens, last, _ = self._buckets.get(key, (burst, now, 0))
+            tokens = min(burst, tokens + (now - last) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                allowed, wait = True, 0.0
+            else:
+                allowed, wait = False, (1 - tokens) / rate
+            # guarda también cuándo el bucket volvería a estar lleno
+            self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+            return allowed, wait
+
+    def _prune(self, now):
+        """Descarta los buckets que ya se habrían rellenado por completo"""
+        for key, (_, _, full_at) in list(self._buckets.items()):
+            if full_at <= now:
+                del self._buckets[key]
+
+
+class LoadShedder:
+    """Rate limiting por cliente y límite de concurrencia por clase de ruta.
+
+    Si se agota el bucket del cliente responde 429; si la clase de ruta ya
+    tiene todos sus slots ocupados responde 503 de inmediato en lugar de
+    encolar. Ambos incluyen Retry-After. Los slots cuentan los threads del
+    proceso, así que sólo tienen efecto con workers gthread.
+    """
+
+    def __init__(self, rates=None, concurrency=None, backend=None,
+                 route_classes=None):
+        self.rates = {**DEFAULT_RATES, **(rates or {})}
+        self.concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self.backend = backend or MemoryBackend()
+        self.route_classes = route_classes or ROUTE_CLASSES
+        self._slots = {
+            name: threading.BoundedSemaphore(limit)
+            for name, limit in self.concurrency.items()
+            if limit > 0
+        }
+        self.rejected = {"429": 0, "503": 0}
+
+    def init_app(self, app: Flask):
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+        app.extensions["load_shedder"] = self
+        return self
+
+    def _before_request(self):
+        route_class = self.route_classes.get(request.endpoint)
+        if route_class is None:
+            return None
+
+        if route_class in self.rates:
+            rate, burst = self.rates[route_class]
+            client = request.remote_addr or "unknown"
+            allowed, wait = self.backend.take(f"{route_class}:{client}", rate, burst)
+            if not allowed:
+                self.rejected["429"] += 1
+                return _reject(
+                    "Rate limit exceeded", status.HTTP_429_TOO_MANY_REQUESTS, wait
+                )
+
+        slots = self._slots.get(route_class)
+        if slots is not None:
+            if not slots.acquire(blocking=False):
+                self.rejected["503"] += 1
+                return _reject(
+                    "Server busy", status.HTTP_503_SERVICE_UNAVAILABLE, 1
+                )
+            g.load_shedder_slot = route_class
+        return None
+
+    def _teardown_request(self, _exc):
+        route_class = g.pop("load_shedder_slot", None)
+        if route_class is not None:
+            self._slots[route_class].release()
+
+
+def _reject(message: str, code: int, retry_after: float):
+    resp = jsonify({"error": message})
+    resp.status_code = code
+    resp.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return resp
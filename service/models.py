@@ -1,8 +1,9 @@
 import logging
+from datetime import datetime, timezone
 from enum import Enum
 from decimal import Decimal
 from flask_sqlalchemy import SQLAlchemy
-from flask import Flask
+from flask import Flask, current_app, has_app_context
 
 # Configuración de logging
 logger = logging.getLogger("flask.app")
@@ -41,29 +42,97 @@ class Product(db.Model):
         nullable=False,
         server_default=(Category.UNKNOWN.name),
     )
+    # Tombstone: los borrados son un UPDATE barato; la compactación purga luego
+    deleted_at = db.Column(db.DateTime, nullable=True, index=True)
 
     def __repr__(self):
         return f"<Product {self.name} id=[{self.id}]>"
 
+    @staticmethod
+    def add_write_listener(app: Flask, listener):
+        """Registra `listener(categories, product_ids)` para escrituras en `app`.
+
+        None en ambos argumentos significa "todos los productos".
+        """
+        app.extensions.setdefault("product_write_listeners", []).append(listener)
+
+    @staticmethod
+    def _notify(categories, product_ids):
+        """Avisa a los suscriptores de la app actual qué productos cambiaron"""
+        for listener in current_app.extensions.get("product_write_listeners", ()):
+            listener(categories, product_ids)
+
+    def _check_writable(self):
+        """Los productos que vienen del snapshot en memoria no se persisten"""
+        if getattr(self, "_from_catalog_snapshot", False):
+            raise DataValidationError(
+                "Producto del snapshot (sólo lectura); usar Product.find"
+            )
+
+    def _touched_categories(self) -> set:
+        """Categoría actual más la anterior si cambió en esta sesión"""
+        history = db.inspect(self).attrs.category.history
+        return {c for c in (*history.deleted, self.category) if c is not None}
+
     def create(self):
         """Crea un nuevo producto en la base de datos"""
         logger.info("Creando %s", self.name)
         self.id = None
         db.session.add(self)
         db.session.commit()
+        self._notify({self.category}, {self.id})
 
     def update(self):
         """Actualiza un producto existente"""
         logger.info("Actualizando %s", self.name)
         if not self.id:
             raise DataValidationError("Update sin ID válido")
+        self._check_writable()
+        categories = self._touched_categories()
         db.session.commit()
+        self._notify(categories, {self.id})
 
     def delete(self):
-        """Elimina un producto de la base de datos"""
+        """Marca el producto como eliminado (soft delete)"""
         logger.info("Eliminando %s", self.name)
+        self._check_writable()
+        self.deleted_at = datetime.now(timezone.utc)
+        categories = self._touched_categories()
+        db.session.commit()
+        self._notify(categories, {self.id})
+
+    def hard_delete(self):
+        """Elimina físicamente el producto de la base de datos"""
+        logger.info("Eliminando definitivamente %s", self.name)
+        self._check_writable()
+        categories = self._touched_categories()
         db.session.delete(self)
         db.session.commit()
+        self._notify(categories, {self.id})
+
+    @classmethod
+    def soft_delete(cls, product_id: int) -> bool:
+        """Marca un producto como eliminado con un único UPDATE por ID"""
+        logger.info("Eliminando producto id=[%s]", product_id)
+        live = cls.live().filter(cls.id == product_id)
+        category = live.with_entities(cls.category).scalar()
+        if category is None:
+            return False
+        live.update(
+            {cls.deleted_at: datetime.now(timezone.utc)},
+            synchronize_session="fetch",
+        )
+        db.session.commit()
+        cls._notify({category}, {product_id})
+        return True
+
+    @classmethod
+    def delete_all(cls):
+        """Elimina físicamente todos los productos (reset de laboratorio)"""
+        logger.info("Eliminando todos los productos")
+        db.session.query(cls).delete()
+        db.session.commit()
+        cls._notify(None, None)
 
     def serialize(self) -> dict:
         """Convierte el objeto a diccionario (para API/JSON)"""
@@ -92,31 +161,105 @@ class Product(db.Model):
         return self
 
     @classmethod
-    def init_db(cls, app: Flask):
+    def init_db(cls, app: Flask, migrate: bool = True):
         """Inicializa la base de datos con la app Flask"""
         logger.info("Inicializando base de datos")
         db.init_app(app)
         app.app_context().push()
+        if migrate:
+            cls.migrate_schema()
+
+    @classmethod
+    def migrate_schema(cls):
+        """Crea/migra el esquema; debe correr en un único proceso"""
         db.create_all()
+        cls._migrate_deleted_at()
+        cls._enable_incremental_vacuum()
+
+    @classmethod
+    def _enable_incremental_vacuum(cls):
+        """Activa auto_vacuum=INCREMENTAL en SQLite (VACUUM único si hace falta)"""
+        if db.engine.dialect.name != "sqlite":
+            return
+        with db.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2:
+                return
+            # En una base existente el cambio sólo se aplica tras un VACUUM
+            logger.info("Activando auto_vacuum incremental (VACUUM único)")
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+
+    @classmethod
+    def _migrate_deleted_at(cls):
+        """Agrega la columna deleted_at a tablas creadas antes del soft delete"""
+        table = cls.__table__
+        columns = {c["name"] for c in db.inspect(db.engine).get_columns(table.name)}
+        if "deleted_at" in columns:
+            return
+        logger.info("Migrando tabla %s: agregando deleted_at", table.name)
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql(
+                f"ALTER TABLE {table.name} ADD COLUMN deleted_at DATETIME"
+            )
+            conn.exec_driver_sql(
+                f"CREATE INDEX IF NOT EXISTS ix_{table.name}_deleted_at "
+                f"ON {table.name} (deleted_at)"
+            )
+
+    @staticmethod
+    def _snapshot():
+        """Snapshot en memoria de la app actual, si el modo está activo"""
+        if not has_app_context():
+            return None
+        return current_app.extensions.get("catalog_snapshot")
+
+    @classmethod
+    def _from_snapshot(cls, rows: list) -> list:
+        """Productos transitorios (sólo lectura) a partir del snapshot"""
+        products = []
+        for row in rows:
+            prod = cls().deserialize(row)
+            prod.id = row["id"]
+            prod._from_catalog_snapshot = True
+            products.append(prod)
+        return products
+
+    @classmethod
+    def live(cls):
+        """Query base que excluye los productos eliminados (tombstones)"""
+        return cls.query.filter(cls.deleted_at.is_(None))
 
     @classmethod
     def all(cls):
         """Devuelve todos los productos"""
-        return cls.query.all()
+        return cls.live().all()
 
     @classmethod
     def find(cls, product_id: int):
         """Busca un producto por ID"""
-        return db.session.get(cls, product_id)
+        prod = db.session.get(cls, product_id)
+        if prod is None or prod.deleted_at is not None:
+            return None
+        return prod
 
     @classmethod
     def find_by_name(cls, name: str):
-        return cls.query.filter(cls.name == name).all()
+        snapshot = cls._snapshot()
+        if snapshot is not None:
+            return cls._from_snapshot(snapshot.filter(name=name))
+        return cls.live().filter(cls.name == name).all()
 
     @classmethod
     def find_by_availability(cls, available: bool = True):
-        return cls.query.filter(cls.available == available).all()
+        snapshot = cls._snapshot()
+        if snapshot is not None:
+            return cls._from_snapshot(snapshot.filter(available=available))
+        return cls.live().filter(cls.available == available).all()
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN):
-        return cls.query.filter(cls.category == category).all()
+        snapshot = cls._snapshot()
+        if snapshot is not None:
+            return cls._from_snapshot(snapshot.filter(category=category))
+        return cls.live().filter(cls.category == category).all()
@@ -1,4 +1,6 @@
-from flask import Blueprint, request, jsonify, render_template
+from flask import Blueprint, current_app, request, jsonify, render_template
+from service.cache import ALL
+from sqlalchemy.exc import SQLAlchemyError
 from service.models import Product, Category, db, DataValidationError
 from service.common import status
 
@@ -16,6 +18,15 @@ def create_product():
 
 @bp.get("/products/<int:pid>")
 def read_product(pid: int):
+    snapshot = current_app.extensions.get("catalog_snapshot")
+    if snapshot is not None:
+        row = snapshot.get(pid)
+        if row is not None:
+            return jsonify(row), status.HTTP_200_OK
+        return (
+            jsonify({"message": f"Product with id '{pid}' was not found."}),
+            status.HTTP_404_NOT_FOUND,
+        )
     prod = Product.find(pid)
     if not prod:
         return (
@@ -42,22 +53,17 @@ def update_product(pid: int):
 
 @bp.delete("/products/<int:pid>")
 def delete_product(pid: int):
-    prod = Product.find(pid)
-    if prod:
-        prod.delete()
+    Product.soft_delete(pid)
     return "", status.HTTP_204_NO_CONTENT
 
 @bp.get("/products")
 def list_products():
     """List -> 200 + array; soporta filtros name/category/available"""
-    q = Product.query
     name = request.args.get("name")
     cat = request.args.get("category")
     avail = request.args.get("available")
 
-    if name:
-        q = q.filter(Product.name == name)
-
+    cat_value = None
     if cat:
         try:
             cat_value = getattr(Category, (cat or "").upper())
@@ -66,21 +72,74 @@ def list_products():
                 jsonify({"error": f"Invalid category '{cat}'"}),
                 status.HTTP_400_BAD_REQUEST,
             )
-        q = q.filter(Product.category == cat_value)
 
+    avail_value = None
     if avail is not None:
         v = (avail or "").strip().lower()
         avail_value = v in ("true", "1", "yes", "y")
-        q = q.filter(Product.available == avail_value)
 
-    return jsonify([p.serialize() for p in q.all()]), status.HTTP_200_OK
+    # Clave normalizada: ?category=food&available=1 == ?available=true&category=FOOD
+    cache = current_app.extensions.get("list_cache")
+    key = (name or None, cat_value.name if cat_value else None, avail_value)
+    if cache is not None:
+        body = cache.get(key)
+        if body is not None:
+            return _json_response(body)
+        dependency = cache.generation(key[1] or ALL)
+
+    snapshot = current_app.extensions.get("catalog_snapshot")
+    if snapshot is not None:
+        rows = snapshot.filter(name or None, cat_value, avail_value)
+    else:
+        q = Product.live()
+        if name:
+            q = q.filter(Product.name == name)
+        if cat_value is not None:
+            q = q.filter(Product.category == cat_value)
+        if avail_value is not None:
+            q = q.filter(Product.available == avail_value)
+        rows = [p.serialize() for p in q.all()]
+
+    body = jsonify(rows).get_data()
+    if cache is not None:
+        cache.put(key, body, dependency)
+    return _json_response(body)
+
+
+@bp.get("/admin/cache")
+def admin_cache_stats():
+    cache = current_app.extensions.get("list_cache")
+    return jsonify(cache.stats() if cache else {}), status.HTTP_200_OK
+
+
+def _json_response(body: bytes):
+    return current_app.response_class(
+        body, status=status.HTTP_200_OK, mimetype="application/json"
+    )
 
 @bp.delete("/admin/reset")
 def admin_reset():
-    db.session.query(Product).delete()
-    db.session.commit()
+    Product.delete_all()
     return "", status.HTTP_200_OK
 
+@bp.get("/health")
+def health():
+    """Liveness: el proceso responde (no toca la base de datos)"""
+    return jsonify({"status": "OK"}), status.HTTP_200_OK
+
+@bp.get("/ready")
+def ready():
+    """Readiness: la conexión a la base responde (sin tocar la tabla products)"""
+    try:
+        db.session.execute(db.text("SELECT 1"))
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return (
+            jsonify({"status": "UNAVAILABLE", "error": str(e)}),
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return jsonify({"status": "OK"}), status.HTTP_200_OK
+
 @bp.get("/")
 def index():
     return render_template("index.html")
\ No newline at end of file
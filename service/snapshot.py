@@ -0,0 +1,159 @@
+import sys
+import threading
+from array import array
+from decimal import Decimal
+
+from service.models import Category, Product, db
+
+
+class CatalogSnapshot:
+    """Copia compacta en memoria de los productos vivos (modo sólo lectura).
+
+    Las columnas id/precio/disponible/categoría viven en arrays tipados
+    (precio en centavos), los nombres se internan y cada fila ocupa una
+    posición estable: al eliminar, la última fila ocupa su lugar. Los
+    índices por categoría y disponibilidad guardan IDs, así que no cambian
+    al mover filas. Se refresca por ID a partir de las escrituras de Product.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self):
+        self._ids = array("q")
+        self._prices = array("q")
+        self._available = array("b")
+        self._categories = array("b")
+        self._names = []
+        self._descriptions = []
+        self._pos = {}
+        self._by_category = {c.value: set() for c in Category}
+        self._by_available = {True: set(), False: set()}
+
+    def __len__(self):
+        return len(self._ids)
+
+    # ---------- carga / refresco ----------
+    def load(self):
+        """Carga (o recarga) todos los productos vivos sin crear objetos ORM"""
+        with self._lock:
+            rows = db.session.execute(_live_rows()).all()
+            self._clear()
+            for row in rows:
+                self._upsert(row)
+
+    def refresh(self, categories=None, product_ids=None):
+        """Listener de escrituras: relee sólo los IDs afectados"""
+        if product_ids is None:
+            self.load()
+            return
+        ids = set(product_ids)
+        # Se relee con el lock tomado: dos refrescos del mismo ID no pueden
+        # aplicarse en desorden y pisar una fila nueva con una vieja.
+        with self._lock:
+            rows = db.session.execute(_live_rows().where(Product.id.in_(ids))).all()
+            for row in rows:
+                self._upsert(row)
+            for pid in ids - {row.id for row in rows}:
+                self._remove(pid)
+
+    def _upsert(self, row):
+        pid = row.id
+        cents = int(Decimal(str(row.price)).scaleb(2))
+        available = bool(row.available)
+        category = row.category.value
+        name = sys.intern(row.name)
+        i = self._pos.get(pid)
+        if i is None:
+            self._pos[pid] = len(self._ids)
+            self._ids.append(pid)
+            self._prices.append(cents)
+            self._available.append(available)
+            self._categories.append(category)
+            self._names.append(name)
+            self._descriptions.append(row.description)
+        else:
+            self._by_category[self._categories[i]].discard(pid)
+            self._by_available[bool(self._available[i])].discard(pid)
+            self._prices[i] = cents
+            self._available[i] = available
+            self._categories[i] = category
+            self._names[i] = name
+            self._descriptions[i] = row.description
+        self._by_category[category].add(pid)
+        self._by_available[available].add(pid)
+
+    def _remove(self, pid):
+        i = self._pos.pop(pid, None)
+        if i is None:
+            return
+        self._by_category[self._categories[i]].discard(pid)
+        self._by_available[bool(self._available[i])].discard(pid)
+        last = len(self._ids) - 1
+        if i != last:
+            moved = self._ids[last]
+            for col in (self._ids, self._prices, self._available,
+                        self._categories, self._names, self._descriptions):
+                col[i] = col[last]
+            self._pos[moved] = i
+        for col in (self._ids, self._prices, self._available,
+                    self._categories, self._names, self._descriptions):
+            col.pop()
+
+    # ---------- lecturas ----------
+    def get(self, product_id: int):
+        """Producto serializado (como Product.serialize) o None"""
+        with self._lock:
+            i = self._pos.get(product_id)
+            return None if i is None else self._row(i)
+
+    def filter(self, name=None, category: Category = None, available: bool = None):
+        """Productos serializados que cumplen los filtros, ordenados por ID"""
+        with self._lock:
+            candidates = None
+            if category is not None:
+                candidates = self._by_category[category.value]
+            if available is not None:
+                ids = self._by_available[available]
+                candidates = ids if candidates is None else candidates & ids
+            if candidates is None:
+                candidates = self._pos.keys()
+            rows = []
+            for pid in sorted(candidates):
+                i = self._pos[pid]
+                if name is None or self._names[i] == name:
+                    rows.append(self._row(i))
+            return rows
+
+    def _row(self, i) -> dict:
+        return {
+            "id": self._ids[i],
+            "name": self._names[i],
+            "description": self._descriptions[i],
+            "price": str(Decimal(self._prices[i]).scaleb(-2)),
+            "available": bool(self._available[i]),
+            "category": Category(self._categories[i]).name,
+        }
+
+    def memory_bytes(self) -> int:
+        """Memoria aproximada ocupada por el snapshot (contenedores + textos)"""
+        with self._lock:
+            containers = [
+                self._ids, self._prices, self._available, self._categories,
+                self._names, self._descriptions, self._pos,
+                *self._by_category.values(), *self._by_available.values(),
+            ]
+            total = sum(sys.getsizeof(c) for c in containers)
+            total += sum(sys.getsizeof(pid) for pid in self._pos)
+            unique_names = {id(n): n for n in self._names}.values()
+            total += sum(sys.getsizeof(n) for n in unique_names)
+            total += sum(sys.getsizeof(d) for d in self._descriptions)
+            return total
+
+
+def _live_rows():
+    return db.select(
+        Product.id, Product.name, Product.description,
+        Product.price, Product.available, Product.category,
+    ).where(Product.deleted_at.is_(None))
@@ -0,0 +1,66 @@
+from service.cache import ALL, ListCache
+from service.models import Category
+
+
+def test_hit_and_miss():
+    cache = ListCache()
+    key = (None, "FOOD", True)
+    assert cache.get(key) is None
+    cache.put(key, b"[]", cache.generation("FOOD"))
+    assert cache.get(key) == b"[]"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes"] == 2
+
+
+def test_invalidate_only_affected_category():
+    cache = ListCache()
+    food = (None, "FOOD", None)
+    tools = (None, "TOOLS", None)
+    everything = (None, None, None)
+    cache.put(food, b"food", cache.generation("FOOD"))
+    cache.put(tools, b"tools", cache.generation("TOOLS"))
+    cache.put(everything, b"all", cache.generation(ALL))
+
+    cache.invalidate({Category.FOOD})
+    assert cache.get(food) is None
+    assert cache.get(everything) is None
+    assert cache.get(tools) == b"tools"
+
+    cache.invalidate(None)
+    assert cache.get(tools) is None
+
+
+def test_stale_put_is_discarded():
+    cache = ListCache()
+    key = (None, "FOOD", None)
+    dependency = cache.generation("FOOD")
+    cache.invalidate({Category.FOOD})  # escritura durante la consulta
+    cache.put(key, b"old", dependency)
+    assert cache.get(key) is None
+
+
+def test_stale_put_after_full_invalidation_is_discarded():
+    cache = ListCache()
+    key = (None, "FOOD", None)
+    dependency = cache.generation("FOOD")  # FOOD nunca se escribió
+    cache.invalidate(None)  # /admin/reset durante la consulta
+    cache.put(key, b"[stale]", dependency)
+    assert cache.get(key) is None
+
+
+def test_memory_bounded_eviction():
+    cache = ListCache(max_bytes=10, max_entries=100)
+    for i in range(5):
+        cache.put(("n", str(i), None), b"abcd", cache.generation(str(i)))
+    stats = cache.stats()
+    assert stats["bytes"] <= 10
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 3
+    # LRU: sobreviven las últimas insertadas
+    assert cache.get(("n", "4", None)) == b"abcd"
+    assert cache.get(("n", "0", None)) is None
+    # una respuesta mayor que el límite no se cachea
+    cache.put(("big", None, None), b"x" * 11, cache.generation(ALL))
+    assert cache.get(("big", None, None)) is None
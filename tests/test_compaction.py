@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from service.app import create_app, migrate
+from service.compaction import Compactor, compact, purge_tombstones
+from service.models import Category, Product, db
+from tests.factories import ProductFactory
+
+
+class TestCompaction(unittest.TestCase):
+    """Pruebas de la purga de tombstones"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app(testing=True)
+        cls.ctx = cls.app.app_context()
+        cls.ctx.push()
+
+    @classmethod
+    def tearDownClass(cls):
+        db.session.remove()
+        cls.ctx.pop()
+
+    def setUp(self):
+        db.session.query(Product).delete()
+        db.session.commit()
+
+    def _tombstones(self):
+        return db.session.query(Product).filter(Product.deleted_at.is_not(None))
+
+    def test_purge_in_batches(self):
+        """It should purge tombstones in batches and keep live rows"""
+        products = ProductFactory.create_batch(7)
+        for p in products:
+            p.create()
+        for p in products[:5]:
+            p.delete()
+
+        self.assertEqual(purge_tombstones(batch_size=2, max_batches=1), 2)
+        self.assertEqual(self._tombstones().count(), 3)
+        self.assertEqual(purge_tombstones(batch_size=2), 3)
+        self.assertEqual(self._tombstones().count(), 0)
+        self.assertEqual(len(Product.all()), 2)
+
+    def test_purge_respects_grace(self):
+        """It should not purge tombstones newer than the grace period"""
+        product = ProductFactory()
+        product.create()
+        product.delete()
+        self.assertEqual(purge_tombstones(grace=timedelta(hours=1)), 0)
+        self.assertEqual(compact(), 1)
+
+    def test_incremental_vacuum_enabled(self):
+        """It should switch SQLite to auto_vacuum=INCREMENTAL on init"""
+        mode = db.session.execute(db.text("PRAGMA auto_vacuum")).scalar()
+        self.assertEqual(mode, 2)
+
+    def test_compactor_thread(self):
+        """It should start and stop the background compactor"""
+        compactor = Compactor(self.app, interval=0.01).start()
+        compactor.stop(timeout=1)
+        self.assertFalse(compactor._thread.is_alive())
+
+
+class TestIncrementalVacuum(unittest.TestCase):
+    """VACUUM incremental sobre una base SQLite en archivo"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        env = {
+            "DATABASE_URI": f"sqlite:///{os.path.join(self.tmp.name, 'p.db')}",
+            "COMPACTION_INTERVAL": "0",
+        }
+        with mock.patch.dict(os.environ, env):
+            self.app = create_app()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+        self.tmp.cleanup()
+
+    def _pragma(self, name):
+        return db.session.execute(db.text(f"PRAGMA {name}")).scalar()
+
+    def test_compact_frees_pages(self):
+        """It should return the pages of purged rows to the filesystem"""
+        with self.app.app_context():
+            db.session.execute(
+                db.insert(Product),
+                [
+                    {
+                        "name": f"P{i}",
+                        "description": "x" * 200,
+                        "price": 1,
+                        "available": True,
+                        "category": Category.FOOD,
+                    }
+                    for i in range(2000)
+                ],
+            )
+            db.session.commit()
+            for pid in range(1, 1601):
+                Product.soft_delete(pid)
+            pages_before = self._pragma("page_count")
+
+            self.assertEqual(compact(batch_size=500, vacuum_pages=100000), 1600)
+            db.session.commit()
+            self.assertEqual(self._pragma("freelist_count"), 0)
+            self.assertLess(self._pragma("page_count"), pages_before - 50)
+
+
+class TestWorkerMode(unittest.TestCase):
+    """Workers de gunicorn: sin migración ni compactación propia"""
+
+    def test_worker_app_skips_compactor(self):
+        """It should migrate once and not start a compactor in workers"""
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                "DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'p.db')}",
+                "COMPACTION_INTERVAL": "60",
+            }
+            with mock.patch.dict(os.environ, env):
+                migrate()
+                app = create_app(worker=True)
+            with app.app_context():
+                self.assertNotIn("compactor", app.extensions)
+                self.assertEqual(Product.all(), [])
+                mode = db.session.execute(db.text("PRAGMA auto_vacuum")).scalar()
+                self.assertEqual(mode, 2)
+                db.session.remove()
+                for engine in db.engines.values():
+                    engine.dispose()
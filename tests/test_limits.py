@@ -0,0 +1,98 @@
+import threading
+
+from service.app import create_app
+from service.common import status
+from service.limits import ROUTE_CLASSES, LoadShedder, MemoryBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(**kwargs):
+    app = create_app(testing=True)
+    shedder = LoadShedder(**kwargs).init_app(app)
+    return app.test_client(), shedder
+
+
+def test_token_bucket_refills():
+    clock = FakeClock()
+    backend = MemoryBackend(clock=clock)
+    assert backend.take("k", rate=2.0, burst=2) == (True, 0.0)
+    assert backend.take("k", rate=2.0, burst=2) == (True, 0.0)
+    allowed, wait = backend.take("k", rate=2.0, burst=2)
+    assert not allowed
+    assert wait == 0.5
+    clock.now = 0.5
+    assert backend.take("k", rate=2.0, burst=2)[0]
+
+
+def test_memory_backend_prunes_idle_buckets():
+    clock = FakeClock()
+    backend = MemoryBackend(clock=clock, max_keys=2)
+    backend.take("a", rate=1.0, burst=1)
+    backend.take("b", rate=1.0, burst=1)
+    clock.now = 10
+    backend.take("c", rate=1.0, burst=1)
+    assert set(backend._buckets) == {"c"}
+
+
+def test_rate_limit_returns_429_with_retry_after():
+    clock = FakeClock()
+    client, shedder = _client(
+        rates={"list": (0.5, 1)}, backend=MemoryBackend(clock=clock)
+    )
+    assert client.get("/products").status_code == status.HTTP_200_OK
+    r = client.get("/products")
+    assert r.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert r.headers["Retry-After"] == "2"
+    assert shedder.rejected["429"] == 1
+    # otras clases de ruta y endpoints sin clase no se ven afectados
+    assert client.get("/products/1").status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/health").status_code == status.HTTP_200_OK
+    clock.now = 2
+    assert client.get("/products").status_code == status.HTTP_200_OK
+
+
+def test_concurrency_limit_sheds_with_503():
+    app = create_app(testing=True)
+    started, release = threading.Event(), threading.Event()
+
+    @app.get("/slow-scan")
+    def slow_scan():
+        started.set()
+        release.wait(5)
+        return "", status.HTTP_200_OK
+
+    shedder = LoadShedder(
+        concurrency={"list": 1},
+        route_classes={**ROUTE_CLASSES, "slow_scan": "list"},
+    ).init_app(app)
+
+    results = []
+    scan = threading.Thread(
+        target=lambda: results.append(app.test_client().get("/slow-scan").status_code)
+    )
+    scan.start()
+    try:
+        assert started.wait(5)
+        # con el list scan en curso, otro scan se rechaza de inmediato...
+        client = app.test_client()
+        r = client.get("/products")
+        assert r.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert r.headers["Retry-After"] == "1"
+        # ...y las lecturas puntuales siguen respondiendo
+        assert client.get("/products/1").status_code == status.HTTP_404_NOT_FOUND
+    finally:
+        release.set()
+        scan.join(5)
+    assert results == [status.HTTP_200_OK]
+
+    # el slot se libera al terminar cada request
+    for _ in range(3):
+        assert client.get("/products").status_code == status.HTTP_200_OK
+    assert shedder.rejected["503"] == 1
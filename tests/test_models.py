@@ -79,6 +79,26 @@ class TestProductModel(unittest.TestCase):
 
         product.delete()
         self.assertEqual(len(Product.all()), 0)
+        self.assertIsNone(Product.find(product.id))
+        # Soft delete: la fila sigue como tombstone hasta la compactación
+        self.assertIsNotNone(db.session.get(Product, product.id).deleted_at)
+
+    def test_soft_delete_by_id(self):
+        """It should soft delete by ID and exclude it from finders"""
+        product = ProductFactory(name="Hat")
+        product.create()
+        self.assertTrue(Product.soft_delete(product.id))
+        self.assertFalse(Product.soft_delete(product.id))
+        self.assertEqual(Product.find_by_name("Hat"), [])
+        self.assertEqual(Product.find_by_category(product.category), [])
+        self.assertEqual(Product.find_by_availability(product.available), [])
+
+    def test_hard_delete_a_product(self):
+        """It should physically remove a Product"""
+        product = ProductFactory()
+        product.create()
+        product.hard_delete()
+        self.assertIsNone(db.session.get(Product, product.id))
 
     # ---------- LIST ALL ----------
     def test_list_all_products(self):
@@ -61,6 +61,9 @@ def test_delete_product():
     r = client.delete(f"/products/{pid}")
     assert r.status_code == status.HTTP_204_NO_CONTENT
     assert r.data == b""
+    assert client.get(f"/products/{pid}").status_code == \
+        status.HTTP_404_NOT_FOUND
+    assert client.get("/products").get_json() == []
 
     # idempotente
     r = client.delete(f"/products/{pid}")
@@ -172,3 +175,43 @@ def test_admin_reset_endpoint():
     r = client.get("/products")
     assert r.status_code == status.HTTP_200_OK
     assert len(r.get_json()) == 0
+
+
+def test_list_cache_hits_and_invalidation():
+    client = _client()
+    _mk(client, category="FOOD")
+    pid = _mk(client, category="TOOLS")
+    assert len(client.get("/products?category=FOOD&available=true").get_json()) == 1
+    # misma consulta normalizada -> hit
+    assert len(client.get("/products?available=1&category=food").get_json()) == 1
+    client.get("/products?category=TOOLS")
+    stats = client.get("/admin/cache").get_json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+    # mover TOOLS -> FOOD invalida ambas categorías
+    r = client.put(
+        f"/products/{pid}",
+        json={
+            "name": "Notebook",
+            "description": "A5 ruled",
+            "price": "9.90",
+            "available": True,
+            "category": "FOOD",
+        },
+    )
+    assert r.status_code == status.HTTP_200_OK
+    assert len(client.get("/products?category=FOOD&available=true").get_json()) == 2
+    assert client.get("/products?category=TOOLS").get_json() == []
+
+    client.delete(f"/products/{pid}")
+    assert len(client.get("/products?category=FOOD").get_json()) == 1
+
+
+def test_health_and_ready():
+    client = _client()
+    r = client.get("/health")
+    assert r.status_code == status.HTTP_200_OK
+    assert r.get_json() == {"status": "OK"}
+    r = client.get("/ready")
+    assert r.status_code == status.HTTP_200_OK
@@ -0,0 +1,111 @@
+from decimal import Decimal
+
+import pytest
+
+from service.app import create_app
+from service.common import status
+from service.models import Category, DataValidationError, Product, db
+from service.snapshot import CatalogSnapshot
+from tests.factories import ProductFactory
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv("CATALOG_SNAPSHOT", "true")
+    app = create_app(testing=True)
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+def _snapshot(app) -> CatalogSnapshot:
+    return app.extensions["catalog_snapshot"]
+
+
+def test_snapshot_tracks_writes(app):
+    snapshot = _snapshot(app)
+    food = ProductFactory(name="Apple", category=Category.FOOD, available=True,
+                          price=Decimal("1.50"))
+    food.create()
+    tools = ProductFactory(name="Hammer", category=Category.TOOLS, available=False)
+    tools.create()
+    assert len(snapshot) == 2
+    assert snapshot.get(food.id)["price"] == "1.50"
+    assert snapshot.get(food.id) == food.serialize()
+
+    food.category = Category.HOUSEWARES
+    food.update()
+    assert snapshot.filter(category=Category.FOOD) == []
+    assert [r["id"] for r in snapshot.filter(category=Category.HOUSEWARES)] == [food.id]
+
+    # eliminar una fila que no es la última mueve la última a su lugar
+    Product.soft_delete(food.id)
+    assert snapshot.get(food.id) is None
+    assert snapshot.get(tools.id)["name"] == "Hammer"
+    assert len(snapshot) == 1
+
+    Product.delete_all()
+    assert len(snapshot) == 0
+
+
+def test_finders_answer_from_snapshot(app):
+    for p in ProductFactory.create_batch(10):
+        p.create()
+    products = Product.all()
+    category = products[0].category
+    expected = sorted(p.id for p in products if p.category == category)
+    found = Product.find_by_category(category)
+    assert [p.id for p in found] == expected
+    assert all(p.category == category for p in found)
+    assert all(p.available for p in Product.find_by_availability(True))
+    name = products[0].name
+    assert {p.id for p in Product.find_by_name(name)} == \
+        {p.id for p in products if p.name == name}
+
+
+def test_snapshot_products_refuse_writes(app):
+    product = ProductFactory(name="Hat", price=Decimal("10.00"))
+    product.create()
+    found = Product.find_by_name("Hat")[0]
+    found.price = Decimal("1.00")
+    with pytest.raises(DataValidationError):
+        found.update()
+    with pytest.raises(DataValidationError):
+        found.delete()
+    with pytest.raises(DataValidationError):
+        found.hard_delete()
+    assert Product.find(product.id).price == Decimal("10.00")
+    # el objeto de Product.find sí se puede modificar
+    writable = Product.find(product.id)
+    writable.price = Decimal("1.00")
+    writable.update()
+    assert Product.find_by_name("Hat")[0].price == Decimal("1.00")
+
+
+def test_routes_read_from_snapshot(app):
+    client = app.test_client()
+    pid = client.post("/products", json={
+        "name": "Notebook",
+        "description": "A5 ruled",
+        "price": "9.90",
+        "available": True,
+        "category": "HOUSEWARES",
+    }).get_json()["id"]
+    r = client.get(f"/products/{pid}")
+    assert r.status_code == status.HTTP_200_OK
+    assert r.get_json()["price"] == "9.90"
+    assert client.get("/products/999999").status_code == status.HTTP_404_NOT_FOUND
+    assert len(client.get("/products?category=housewares&available=true").get_json()) == 1
+    client.delete(f"/products/{pid}")
+    assert client.get(f"/products/{pid}").status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/products").get_json() == []
+
+
+def test_memory_per_product_is_compact(app):
+    for p in ProductFactory.create_batch(500):
+        p.create()
+    snapshot = _snapshot(app)
+    snapshot.load()
+    per_product = snapshot.memory_bytes() / len(snapshot)
+    # una instancia ORM con su estado supera 1 KB; el snapshot, unos cientos de bytes
+    assert per_product < 600